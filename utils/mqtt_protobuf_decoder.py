@@ -16,10 +16,13 @@ Configuration:
 """
 
 import paho.mqtt.client as mqtt
+import logging
+import queue
 import struct
+import sys
+import threading
 import time
-import json
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 # MQTT Configuration
 MQTT_BROKER = "129.212.148.141"
@@ -28,10 +31,154 @@ MQTT_USER = "lsmonitor"
 MQTT_PASS = "thisisasecret"
 MQTT_TOPIC = "controller/protobuff"
 
+logger = logging.getLogger(__name__)
+
+# Messages buffered between the MQTT network thread and the decode thread
+MESSAGE_QUEUE_SIZE = 1000
+# Most messages the decode thread takes from the queue per output write
+MESSAGE_BATCH_SIZE = 256
+# Seconds to wait for the decode thread to drain on shutdown
+SHUTDOWN_TIMEOUT = 5.0
+# Minimum seconds between sequence gap summaries in the log
+SEQUENCE_GAP_LOG_INTERVAL = 5.0
+
+# Precompiled little-endian layouts for the message header and payloads
+_HEADER = struct.Struct('<BBBL')  # size, type, sequence, timestamp
+_PAYLOAD_OFFSET = _HEADER.size
+_DIGITAL_INPUT = struct.Struct('<BBH')
+_DIGITAL_OUTPUT = struct.Struct('<BBB')
+_RELAY_EVENT = struct.Struct('<BBB')
+_PRESSURE = struct.Struct('<BBHf')
+_SYSTEM_ERROR_HEADER = struct.Struct('<BBB')
+_SAFETY_EVENT = struct.Struct('<BBB')
+_SYSTEM_STATUS = struct.Struct('<LHHL')  # uptime, loop Hz, free memory, status word
+_SEQUENCE_EVENT = struct.Struct('<BBH')
+
+# Name tables for sparse codes
+_MESSAGE_TYPE_NAMES = {
+    0x10: 'DIGITAL_INPUT',
+    0x11: 'DIGITAL_OUTPUT',
+    0x12: 'RELAY_EVENT',
+    0x13: 'PRESSURE',
+    0x14: 'SYSTEM_ERROR',
+    0x15: 'SAFETY_EVENT',
+    0x16: 'SYSTEM_STATUS',
+    0x17: 'SEQUENCE_EVENT'
+}
+_RELAY_TYPE_NAMES = {
+    0x00: 'UNKNOWN',
+    0x01: 'HYDRAULIC_EXTEND',
+    0x02: 'HYDRAULIC_RETRACT',
+    0x07: 'OPERATOR_BUZZER',
+    0x08: 'ENGINE_STOP',
+    0x09: 'POWER_CONTROL'
+}
+_ERROR_CODE_NAMES = {
+    0x01: 'EEPROM_CRC',
+    0x02: 'EEPROM_SAVE',
+    0x04: 'SENSOR_FAULT',
+    0x08: 'NETWORK_PERSISTENT',
+    0x10: 'CONFIG_INVALID',
+    0x20: 'MEMORY_LOW',
+    0x40: 'HARDWARE_FAULT',
+    0x80: 'SEQUENCE_TIMEOUT'
+}
+
+# Name tables for fields whose codes run contiguously from 0, indexed by code
+_INPUT_TYPE_NAMES = (
+    'UNKNOWN',            # 0x00
+    'MANUAL_EXTEND',      # 0x01
+    'MANUAL_RETRACT',     # 0x02
+    'SAFETY_CLEAR',       # 0x03
+    'SEQUENCE_START',     # 0x04
+    'LIMIT_EXTEND',       # 0x05
+    'LIMIT_RETRACT',      # 0x06
+    'SPLITTER_OPERATOR',  # 0x07
+    'EMERGENCY_STOP'      # 0x08
+)
+_OUTPUT_TYPE_NAMES = ('UNKNOWN', 'MILL_LAMP', 'STATUS_LED')
+_MILL_LAMP_PATTERN_NAMES = ('OFF', 'SOLID', 'SLOW_BLINK', 'FAST_BLINK')
+_PRESSURE_TYPE_NAMES = ('UNKNOWN', 'SYSTEM_PRESSURE', 'TANK_PRESSURE', 'LOAD_PRESSURE', 'AUXILIARY')
+_SEVERITY_NAMES = ('INFO', 'WARNING', 'ERROR', 'CRITICAL')
+_SAFETY_EVENT_NAMES = (
+    'SAFETY_ACTIVATED',           # 0x00
+    'SAFETY_CLEARED',             # 0x01
+    'EMERGENCY_STOP_ACTIVATED',   # 0x02
+    'EMERGENCY_STOP_CLEARED',     # 0x03
+    'LIMIT_SWITCH_TRIGGERED',     # 0x04
+    'PRESSURE_SAFETY'             # 0x05
+)
+_SEQUENCE_STATE_NAMES = (
+    'IDLE',         # 0x00
+    'EXTENDING',    # 0x01
+    'EXTENDED',     # 0x02
+    'RETRACTING',   # 0x03
+    'RETRACTED',    # 0x04
+    'PAUSED',       # 0x05
+    'ERROR_STATE'   # 0x06
+)
+_SEQUENCE_EVENT_NAMES = (
+    'SEQUENCE_STARTED',         # 0x00
+    'SEQUENCE_STEP_COMPLETE',   # 0x01
+    'SEQUENCE_COMPLETE',        # 0x02
+    'SEQUENCE_PAUSED',          # 0x03
+    'SEQUENCE_RESUMED',         # 0x04
+    'SEQUENCE_ABORTED',         # 0x05
+    'SEQUENCE_TIMEOUT'          # 0x06
+)
+
+
+def _lookup_name(names: tuple, code: int) -> str:
+    """Name for a code in a contiguous name table, UNKNOWN_<code> past the end"""
+    return names[code] if code < len(names) else f'UNKNOWN_{code}'
+
+
+def _digital_input_flags(flags: int) -> tuple:
+    input_type = (flags >> 2) & 0x3F
+    return (bool(flags & 0x01), 'ACTIVE' if (flags & 0x01) else 'INACTIVE',
+            bool(flags & 0x02),
+            input_type, _lookup_name(_INPUT_TYPE_NAMES, input_type))
+
+
+def _digital_output_flags(flags: int) -> tuple:
+    output_type = (flags >> 1) & 0x07
+    pattern = (flags >> 4) & 0x0F
+    return (bool(flags & 0x01), 'HIGH' if (flags & 0x01) else 'LOW',
+            output_type, _lookup_name(_OUTPUT_TYPE_NAMES, output_type),
+            pattern, _lookup_name(_MILL_LAMP_PATTERN_NAMES, pattern))
+
+
+def _relay_event_flags(flags: int) -> tuple:
+    relay_type = (flags >> 3) & 0x1F
+    return (bool(flags & 0x01), 'ON' if (flags & 0x01) else 'OFF',
+            bool(flags & 0x02), 'MANUAL' if (flags & 0x02) else 'AUTO',
+            bool(flags & 0x04), 'SUCCESS' if (flags & 0x04) else 'FAILED',
+            relay_type, _RELAY_TYPE_NAMES.get(relay_type) or f'RESERVED_{relay_type}')
+
+
+def _pressure_flags(flags: int) -> tuple:
+    pressure_type = (flags >> 1) & 0x7F
+    return (bool(flags & 0x01), 'FAULT' if (flags & 0x01) else 'OK',
+            pressure_type, _lookup_name(_PRESSURE_TYPE_NAMES, pressure_type))
+
+
+# Every field derived from a payload flags byte, precomputed for all 256 values
+_DIGITAL_INPUT_FLAGS = tuple(_digital_input_flags(flags) for flags in range(256))
+_DIGITAL_OUTPUT_FLAGS = tuple(_digital_output_flags(flags) for flags in range(256))
+_RELAY_EVENT_FLAGS = tuple(_relay_event_flags(flags) for flags in range(256))
+_PRESSURE_FLAGS = tuple(_pressure_flags(flags) for flags in range(256))
+
 class LogSplitterProtobufDecoder:
     """Decoder for LogSplitter Controller binary protobuf messages"""
     
-    def __init__(self):
+    # Fixed attribute set: slot access is cheaper than instance dict lookups
+    __slots__ = ('include_hex', 'message_handlers', '_handlers',
+                 'messages_received', 'messages_decoded', 'decode_errors',
+                 'last_sequence', 'sequence_gaps', '_pending_gaps', '_last_gap_log')
+    
+    def __init__(self, include_hex: bool = False):
+        # raw_payload_hex is only filled in when requested
+        self.include_hex = include_hex
         self.message_handlers = {
             0x10: self._decode_digital_input,
             0x11: self._decode_digital_output,
@@ -43,52 +190,57 @@ class LogSplitterProtobufDecoder:
             0x17: self._decode_sequence_event
         }
         
+        # Dispatch table indexed directly by the type byte (None = unknown type)
+        self._handlers = [self.message_handlers.get(msg_type) for msg_type in range(256)]
+        
         # Statistics
         self.messages_received = 0
         self.messages_decoded = 0
         self.decode_errors = 0
-        self.last_sequence = {}  # Track sequence numbers per message type
+        self.last_sequence = [-1] * 256  # Last sequence number per message type, -1 = none yet
+        self.sequence_gaps = 0
+        self._pending_gaps = [0] * 256  # Gaps per message type not yet logged
+        self._last_gap_log = time.monotonic() - SEQUENCE_GAP_LOG_INTERVAL
         
     def decode_message(self, binary_data: bytes) -> Optional[Dict[str, Any]]:
         """Decode a complete protobuf message from MQTT"""
         try:
             self.messages_received += 1
+            length = len(binary_data)
             
-            if len(binary_data) < 7:  # Minimum message size (1 size byte + 6 header)
+            if length < _PAYLOAD_OFFSET:  # Minimum message size (1 size byte + 6 header)
                 self.decode_errors += 1
-                print(f"ERROR: Message too short: {len(binary_data)} bytes")
+                logger.error("Message too short: %d bytes", length)
                 return None
             
             # Parse header
             # Per TELEMETRY_API.md: SIZE byte = header + payload length (NOT including size byte itself)
-            size_byte = binary_data[0]
-            if (size_byte + 1) != len(binary_data):
+            size_byte, msg_type, sequence, timestamp = _HEADER.unpack_from(binary_data)
+            if (size_byte + 1) != length:
                 self.decode_errors += 1
-                print(f"ERROR: Size mismatch: SIZE byte={size_byte}, expected total={size_byte + 1}, got {len(binary_data)}")
+                logger.error("Size mismatch: SIZE byte=%d, expected total=%d, got %d",
+                             size_byte, size_byte + 1, length)
                 return None
             
-            msg_type = binary_data[1]
-            sequence = binary_data[2]
-            timestamp = struct.unpack('<L', binary_data[3:7])[0]  # Little-endian uint32
-            payload = binary_data[7:] if len(binary_data) > 7 else b''
-            
             # Check for missing messages
-            if msg_type in self.last_sequence:
-                expected_seq = (self.last_sequence[msg_type] + 1) % 256
+            sequences = self.last_sequence
+            last_sequence = sequences[msg_type]
+            if last_sequence >= 0:
+                expected_seq = (last_sequence + 1) % 256
                 if sequence != expected_seq:
-                    print(f"WARNING: Sequence gap for type 0x{msg_type:02X}: "
-                          f"expected {expected_seq}, got {sequence}")
+                    self._record_sequence_gap(msg_type)
             
-            self.last_sequence[msg_type] = sequence
+            sequences[msg_type] = sequence
             
             # Decode payload based on message type
             decoded_payload = None
-            if msg_type in self.message_handlers:
-                decoded_payload = self.message_handlers[msg_type](payload)
+            handler = self._handlers[msg_type]
+            if handler is not None:
+                decoded_payload = handler(binary_data, _PAYLOAD_OFFSET)
                 if decoded_payload is not None:
                     self.messages_decoded += 1
             else:
-                print(f"WARNING: Unknown message type: 0x{msg_type:02X}")
+                logger.warning("Unknown message type: 0x%02X", msg_type)
             
             return {
                 'size': size_byte,
@@ -98,93 +250,104 @@ class LogSplitterProtobufDecoder:
                 'timestamp': timestamp,
                 'timestamp_sec': timestamp / 1000.0,
                 'payload': decoded_payload,
-                'raw_payload_hex': payload.hex() if payload else ''
+                'raw_payload_hex': binary_data[_PAYLOAD_OFFSET:].hex() if self.include_hex else ''
             }
             
         except Exception as e:
             self.decode_errors += 1
-            print(f"ERROR: Decode exception: {e}")
+            logger.error("Decode exception: %s", e)
             return None
     
-    def _decode_digital_input(self, payload: bytes) -> Optional[Dict[str, Any]]:
-        if len(payload) < 4:
+    def _decode_digital_input(self, buf: bytes, offset: int) -> Optional[Dict[str, Any]]:
+        if len(buf) - offset < 4:
             return None
         
-        pin, flags, debounce_time = struct.unpack('<BBH', payload)
+        pin, flags, debounce_time = _DIGITAL_INPUT.unpack_from(buf, offset)
+        state, state_name, is_debounced, input_type, input_type_name = _DIGITAL_INPUT_FLAGS[flags]
         
         return {
             'pin': pin,
-            'state': bool(flags & 0x01),
-            'state_name': 'ACTIVE' if (flags & 0x01) else 'INACTIVE',
-            'is_debounced': bool(flags & 0x02),
-            'input_type': (flags >> 2) & 0x3F,
-            'input_type_name': self._get_input_type_name((flags >> 2) & 0x3F),
+            'state': state,
+            'state_name': state_name,
+            'is_debounced': is_debounced,
+            'input_type': input_type,
+            'input_type_name': input_type_name,
             'debounce_time_ms': debounce_time
         }
     
-    def _decode_digital_output(self, payload: bytes) -> Optional[Dict[str, Any]]:
-        if len(payload) < 3:
+    def _decode_digital_output(self, buf: bytes, offset: int) -> Optional[Dict[str, Any]]:
+        if len(buf) - offset < 3:
             return None
         
-        pin, flags, reserved = struct.unpack('<BBB', payload)
+        pin, flags, reserved = _DIGITAL_OUTPUT.unpack_from(buf, offset)
+        (state, state_name, output_type, output_type_name,
+         mill_lamp_pattern, mill_lamp_pattern_name) = _DIGITAL_OUTPUT_FLAGS[flags]
         
         return {
             'pin': pin,
-            'state': bool(flags & 0x01),
-            'state_name': 'HIGH' if (flags & 0x01) else 'LOW',
-            'output_type': (flags >> 1) & 0x07,
-            'output_type_name': self._get_output_type_name((flags >> 1) & 0x07),
-            'mill_lamp_pattern': (flags >> 4) & 0x0F,
-            'mill_lamp_pattern_name': self._get_mill_lamp_pattern_name((flags >> 4) & 0x0F)
+            'state': state,
+            'state_name': state_name,
+            'output_type': output_type,
+            'output_type_name': output_type_name,
+            'mill_lamp_pattern': mill_lamp_pattern,
+            'mill_lamp_pattern_name': mill_lamp_pattern_name
         }
     
-    def _decode_relay_event(self, payload: bytes) -> Optional[Dict[str, Any]]:
-        if len(payload) < 3:
+    def _decode_relay_event(self, buf: bytes, offset: int) -> Optional[Dict[str, Any]]:
+        if len(buf) - offset < 3:
             return None
         
-        relay_number, flags, reserved = struct.unpack('<BBB', payload)
+        relay_number, flags, reserved = _RELAY_EVENT.unpack_from(buf, offset)
+        (state, state_name, is_manual, operation_mode,
+         success, success_name, relay_type, relay_type_name) = _RELAY_EVENT_FLAGS[flags]
         
         return {
             'relay_number': relay_number,
             'relay_name': f'R{relay_number}',
-            'state': bool(flags & 0x01),
-            'state_name': 'ON' if (flags & 0x01) else 'OFF',
-            'is_manual': bool(flags & 0x02),
-            'operation_mode': 'MANUAL' if (flags & 0x02) else 'AUTO',
-            'success': bool(flags & 0x04),
-            'success_name': 'SUCCESS' if (flags & 0x04) else 'FAILED',
-            'relay_type': (flags >> 3) & 0x1F,
-            'relay_type_name': self._get_relay_type_name((flags >> 3) & 0x1F)
+            'state': state,
+            'state_name': state_name,
+            'is_manual': is_manual,
+            'operation_mode': operation_mode,
+            'success': success,
+            'success_name': success_name,
+            'relay_type': relay_type,
+            'relay_type_name': relay_type_name
         }
     
-    def _decode_pressure(self, payload: bytes) -> Optional[Dict[str, Any]]:
-        if len(payload) < 8:
+    def _decode_pressure(self, buf: bytes, offset: int) -> Optional[Dict[str, Any]]:
+        if len(buf) - offset < 8:
             return None
         
-        sensor_pin, flags, raw_value = struct.unpack('<BBH', payload[:4])
-        pressure_psi = struct.unpack('<f', payload[4:8])[0]
+        sensor_pin, flags, raw_value, pressure_psi = _PRESSURE.unpack_from(buf, offset)
+        is_fault, fault_status, pressure_type, pressure_type_name = _PRESSURE_FLAGS[flags]
         
         return {
             'sensor_pin': sensor_pin,
             'sensor_name': f'A{sensor_pin}',
-            'is_fault': bool(flags & 0x01),
-            'fault_status': 'FAULT' if (flags & 0x01) else 'OK',
-            'pressure_type': (flags >> 1) & 0x7F,
-            'pressure_type_name': self._get_pressure_type_name((flags >> 1) & 0x7F),
+            'is_fault': is_fault,
+            'fault_status': fault_status,
+            'pressure_type': pressure_type,
+            'pressure_type_name': pressure_type_name,
             'raw_adc_value': raw_value,
             'pressure_psi': round(pressure_psi, 2)
         }
     
-    def _decode_system_error(self, payload: bytes) -> Optional[Dict[str, Any]]:
-        if len(payload) < 3:
+    def _decode_system_error(self, buf: bytes, offset: int) -> Optional[Dict[str, Any]]:
+        length = len(buf) - offset
+        if length < 3:
             return None
         
-        error_code, flags, desc_length = struct.unpack('<BBB', payload[:3])
+        error_code, flags, desc_length = _SYSTEM_ERROR_HEADER.unpack_from(buf, offset)
         
         description = ""
-        if desc_length > 0 and len(payload) > 3:
-            desc_bytes = payload[3:3+min(desc_length, len(payload)-3)]
-            description = desc_bytes.decode('ascii', errors='ignore').rstrip('\x00')
+        if desc_length > 0 and length > 3:
+            # C string: stop at the first NUL within the declared length
+            start = offset + 3
+            end = start + min(desc_length, length - 3)
+            nul = buf.find(0, start, end)
+            if nul != -1:
+                end = nul
+            description = str(memoryview(buf)[start:end], 'ascii', 'ignore')
         
         return {
             'error_code': error_code,
@@ -197,11 +360,11 @@ class LogSplitterProtobufDecoder:
             'description': description
         }
     
-    def _decode_safety_event(self, payload: bytes) -> Optional[Dict[str, Any]]:
-        if len(payload) < 3:
+    def _decode_safety_event(self, buf: bytes, offset: int) -> Optional[Dict[str, Any]]:
+        if len(buf) - offset < 3:
             return None
         
-        event_type, flags, reserved = struct.unpack('<BBB', payload)
+        event_type, flags, reserved = _SAFETY_EVENT.unpack_from(buf, offset)
         
         return {
             'event_type': event_type,
@@ -210,12 +373,15 @@ class LogSplitterProtobufDecoder:
             'status': 'ACTIVE' if (flags & 0x01) else 'INACTIVE'
         }
     
-    def _decode_system_status(self, payload: bytes) -> Optional[Dict[str, Any]]:
-        if len(payload) < 12:
+    def _decode_system_status(self, buf: bytes, offset: int) -> Optional[Dict[str, Any]]:
+        if len(buf) - offset < 12:
             return None
         
-        uptime_ms, loop_freq_hz, free_memory, active_errors, flags, reserved = \
-            struct.unpack('<LHHBBH', payload)
+        uptime_ms, loop_freq_hz, free_memory, status_word = _SYSTEM_STATUS.unpack_from(buf, offset)
+        
+        # Status word: bits 0-7 active error count, bits 8-15 flags, bits 16-31 reserved
+        sequence_state = (status_word >> 10) & 0x0F
+        mill_lamp_pattern = (status_word >> 14) & 0x03
         
         return {
             'uptime_ms': uptime_ms,
@@ -223,20 +389,20 @@ class LogSplitterProtobufDecoder:
             'uptime_minutes': round(uptime_ms / 60000.0, 1),
             'loop_frequency_hz': loop_freq_hz,
             'free_memory_bytes': free_memory,
-            'active_error_count': active_errors,
-            'safety_active': bool(flags & 0x01),
-            'estop_active': bool(flags & 0x02),
-            'sequence_state': (flags >> 2) & 0x0F,
-            'sequence_state_name': self._get_sequence_state_name((flags >> 2) & 0x0F),
-            'mill_lamp_pattern': (flags >> 6) & 0x03,
-            'mill_lamp_pattern_name': self._get_mill_lamp_pattern_name((flags >> 6) & 0x03)
+            'active_error_count': status_word & 0xFF,
+            'safety_active': bool(status_word & 0x0100),
+            'estop_active': bool(status_word & 0x0200),
+            'sequence_state': sequence_state,
+            'sequence_state_name': self._get_sequence_state_name(sequence_state),
+            'mill_lamp_pattern': mill_lamp_pattern,
+            'mill_lamp_pattern_name': _MILL_LAMP_PATTERN_NAMES[mill_lamp_pattern]
         }
     
-    def _decode_sequence_event(self, payload: bytes) -> Optional[Dict[str, Any]]:
-        if len(payload) < 4:
+    def _decode_sequence_event(self, buf: bytes, offset: int) -> Optional[Dict[str, Any]]:
+        if len(buf) - offset < 4:
             return None
         
-        event_type, step_number, elapsed_time_ms = struct.unpack('<BBH', payload)
+        event_type, step_number, elapsed_time_ms = _SEQUENCE_EVENT.unpack_from(buf, offset)
         
         return {
             'event_type': event_type,
@@ -248,126 +414,44 @@ class LogSplitterProtobufDecoder:
     
     # Name lookup methods
     def _get_type_name(self, msg_type: int) -> str:
-        types = {
-            0x10: 'DIGITAL_INPUT',
-            0x11: 'DIGITAL_OUTPUT', 
-            0x12: 'RELAY_EVENT',
-            0x13: 'PRESSURE',
-            0x14: 'SYSTEM_ERROR',
-            0x15: 'SAFETY_EVENT',
-            0x16: 'SYSTEM_STATUS',
-            0x17: 'SEQUENCE_EVENT'
-        }
-        return types.get(msg_type, f'UNKNOWN_0x{msg_type:02X}')
-    
-    def _get_input_type_name(self, input_type: int) -> str:
-        types = {
-            0x00: 'UNKNOWN',
-            0x01: 'MANUAL_EXTEND',
-            0x02: 'MANUAL_RETRACT', 
-            0x03: 'SAFETY_CLEAR',
-            0x04: 'SEQUENCE_START',
-            0x05: 'LIMIT_EXTEND',
-            0x06: 'LIMIT_RETRACT',
-            0x07: 'SPLITTER_OPERATOR',
-            0x08: 'EMERGENCY_STOP'
-        }
-        return types.get(input_type, f'UNKNOWN_{input_type}')
-    
-    def _get_output_type_name(self, output_type: int) -> str:
-        types = {
-            0x00: 'UNKNOWN',
-            0x01: 'MILL_LAMP',
-            0x02: 'STATUS_LED'
-        }
-        return types.get(output_type, f'UNKNOWN_{output_type}')
-    
-    def _get_mill_lamp_pattern_name(self, pattern: int) -> str:
-        patterns = {
-            0x00: 'OFF',
-            0x01: 'SOLID',
-            0x02: 'SLOW_BLINK',
-            0x03: 'FAST_BLINK'
-        }
-        return patterns.get(pattern, f'UNKNOWN_{pattern}')
-    
-    def _get_relay_type_name(self, relay_type: int) -> str:
-        types = {
-            0x00: 'UNKNOWN',
-            0x01: 'HYDRAULIC_EXTEND',
-            0x02: 'HYDRAULIC_RETRACT',
-            0x07: 'OPERATOR_BUZZER',
-            0x08: 'ENGINE_STOP',
-            0x09: 'POWER_CONTROL'
-        }
-        return types.get(relay_type, f'RESERVED_{relay_type}')
-    
-    def _get_pressure_type_name(self, pressure_type: int) -> str:
-        types = {
-            0x00: 'UNKNOWN',
-            0x01: 'SYSTEM_PRESSURE',
-            0x02: 'TANK_PRESSURE',
-            0x03: 'LOAD_PRESSURE',
-            0x04: 'AUXILIARY'
-        }
-        return types.get(pressure_type, f'UNKNOWN_{pressure_type}')
+        return _MESSAGE_TYPE_NAMES.get(msg_type) or f'UNKNOWN_0x{msg_type:02X}'
     
     def _get_error_code_name(self, error_code: int) -> str:
-        codes = {
-            0x01: 'EEPROM_CRC',
-            0x02: 'EEPROM_SAVE',
-            0x04: 'SENSOR_FAULT',
-            0x08: 'NETWORK_PERSISTENT',
-            0x10: 'CONFIG_INVALID',
-            0x20: 'MEMORY_LOW',
-            0x40: 'HARDWARE_FAULT',
-            0x80: 'SEQUENCE_TIMEOUT'
-        }
-        return codes.get(error_code, f'UNKNOWN_0x{error_code:02X}')
+        return _ERROR_CODE_NAMES.get(error_code) or f'UNKNOWN_0x{error_code:02X}'
     
     def _get_severity_name(self, severity: int) -> str:
-        levels = {
-            0x00: 'INFO',
-            0x01: 'WARNING',
-            0x02: 'ERROR', 
-            0x03: 'CRITICAL'
-        }
-        return levels.get(severity, f'UNKNOWN_{severity}')
+        return _lookup_name(_SEVERITY_NAMES, severity)
     
     def _get_safety_event_name(self, event_type: int) -> str:
-        events = {
-            0x00: 'SAFETY_ACTIVATED',
-            0x01: 'SAFETY_CLEARED',
-            0x02: 'EMERGENCY_STOP_ACTIVATED',
-            0x03: 'EMERGENCY_STOP_CLEARED',
-            0x04: 'LIMIT_SWITCH_TRIGGERED',
-            0x05: 'PRESSURE_SAFETY'
-        }
-        return events.get(event_type, f'UNKNOWN_{event_type}')
+        return _lookup_name(_SAFETY_EVENT_NAMES, event_type)
     
     def _get_sequence_state_name(self, state: int) -> str:
-        states = {
-            0x00: 'IDLE',
-            0x01: 'EXTENDING',
-            0x02: 'EXTENDED',
-            0x03: 'RETRACTING',
-            0x04: 'RETRACTED',
-            0x05: 'PAUSED',
-            0x06: 'ERROR_STATE'
-        }
-        return states.get(state, f'UNKNOWN_{state}')
+        return _lookup_name(_SEQUENCE_STATE_NAMES, state)
     
     def _get_sequence_event_name(self, event_type: int) -> str:
-        events = {
-            0x00: 'SEQUENCE_STARTED',
-            0x01: 'SEQUENCE_STEP_COMPLETE',
-            0x02: 'SEQUENCE_COMPLETE',
-            0x03: 'SEQUENCE_PAUSED',
-            0x04: 'SEQUENCE_RESUMED',
-            0x05: 'SEQUENCE_ABORTED',
-            0x06: 'SEQUENCE_TIMEOUT'
-        }
-        return events.get(event_type, f'UNKNOWN_{event_type}')
+        return _lookup_name(_SEQUENCE_EVENT_NAMES, event_type)
+    
+    def _record_sequence_gap(self, msg_type: int):
+        """Count a sequence gap, logging a summary at most every SEQUENCE_GAP_LOG_INTERVAL"""
+        self.sequence_gaps += 1
+        self._pending_gaps[msg_type] += 1
+        self.maybe_log_sequence_gaps()
+    
+    def maybe_log_sequence_gaps(self):
+        """Log pending sequence gaps if SEQUENCE_GAP_LOG_INTERVAL has passed"""
+        if time.monotonic() - self._last_gap_log >= SEQUENCE_GAP_LOG_INTERVAL:
+            self.log_sequence_gaps()
+    
+    def log_sequence_gaps(self):
+        """Log and reset the sequence gaps counted since the last summary"""
+        self._last_gap_log = time.monotonic()
+        counts = [(msg_type, gaps) for msg_type, gaps in enumerate(self._pending_gaps) if gaps]
+        if not counts:
+            return
+        
+        self._pending_gaps = [0] * 256
+        logger.warning("Sequence gaps: %s",
+                       ", ".join(f"{self._get_type_name(msg_type)} x{gaps}" for msg_type, gaps in counts))
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get decoder statistics"""
@@ -379,10 +463,28 @@ class LogSplitterProtobufDecoder:
             'messages_received': self.messages_received,
             'messages_decoded': self.messages_decoded,
             'decode_errors': self.decode_errors,
+            'sequence_gaps': self.sequence_gaps,
             'success_rate_percent': round(success_rate, 1)
         }
 
 
+# Label fields left out of the printed payload
+_HIDDEN_FIELDS = frozenset(['state_name', 'status', 'operation_mode', 'success_name', 'fault_status'])
+
+
+def _display_fields(payload: Dict[str, Any]) -> tuple:
+    """(key, name key or None) for each payload field the monitor prints"""
+    fields = []
+    for key in payload:
+        if key.endswith('_name') or key in _HIDDEN_FIELDS:
+            continue  # Skip name fields for cleaner output
+        
+        # Show name alongside numeric values where available
+        name_key = key + '_name'
+        fields.append((key, name_key if name_key in payload else None))
+    return tuple(fields)
+
+
 class MQTTProtobufMonitor:
     """MQTT client for monitoring LogSplitter protobuf messages"""
     
@@ -391,7 +493,15 @@ class MQTTProtobufMonitor:
         self.decoder = LogSplitterProtobufDecoder()
         self.client = mqtt.Client()
         self.connected = False
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
+        self.messages_dropped = 0
+        self._field_layouts = {}  # Printed payload layout per message type
+        
+        # Decode and print on a worker thread so the MQTT network loop
+        # never waits on stdout
+        self.message_queue = queue.Queue(maxsize=MESSAGE_QUEUE_SIZE)
+        self.worker = threading.Thread(target=self._process_messages, daemon=True)
+        self.worker.start()
         
         # Configure MQTT client
         if username and password:
@@ -426,52 +536,99 @@ class MQTTProtobufMonitor:
         print(f"Disconnected from MQTT broker (result code {rc})")
     
     def _on_message(self, client, userdata, msg):
-        """Handle incoming MQTT message"""
+        """Queue incoming MQTT message for the decode thread"""
         if msg.topic == MQTT_TOPIC:
-            timestamp = time.strftime("%H:%M:%S", time.localtime())
+            try:
+                self.message_queue.put_nowait((time.time(), msg.payload))
+            except queue.Full:
+                self.messages_dropped += 1
+    
+    def _process_messages(self):
+        """Decode and print queued messages in batches until a None sentinel arrives"""
+        running = True
+        timestamp_second = None
+        timestamp = ''
+        while running:
+            # Block for one message, then take whatever else is already waiting
+            batch = [self.message_queue.get()]
+            while len(batch) < MESSAGE_BATCH_SIZE:
+                try:
+                    batch.append(self.message_queue.get_nowait())
+                except queue.Empty:
+                    break
             
-            # Decode the binary protobuf message
-            decoded = self.decoder.decode_message(msg.payload)
+            # The shutdown sentinel is always the last item queued
+            if batch[-1] is None:
+                running = False
+                batch.pop()
             
-            if decoded:
-                self._print_decoded_message(timestamp, decoded)
-            else:
-                print(f"[{timestamp}] DECODE ERROR: {len(msg.payload)} bytes")
-                print(f"  Raw hex: {msg.payload.hex()}")
-                print()
-    
-    def _print_decoded_message(self, timestamp: str, decoded: Dict[str, Any]):
-        """Pretty print a decoded message"""
-        print(f"[{timestamp}] {decoded['type_name']} (0x{decoded['type']:02X})")
-        print(f"  Sequence: {decoded['sequence']}")
-        print(f"  Timestamp: {decoded['timestamp']} ms ({decoded['timestamp_sec']:.1f}s)")
-        
-        if decoded['payload']:
-            print(f"  Payload:")
-            for key, value in decoded['payload'].items():
-                if key.endswith('_name') or key in ['state_name', 'status', 'operation_mode', 'success_name', 'fault_status']:
-                    continue  # Skip name fields for cleaner output
+            # A failed batch (e.g. BrokenPipeError on stdout) must not kill the
+            # thread, or every later message would be counted as dropped
+            try:
+                lines = []
+                for received_at, payload in batch:
+                    # The display timestamp has one-second resolution, so only
+                    # reformat it when the second changes
+                    second = int(received_at)
+                    if second != timestamp_second:
+                        timestamp_second = second
+                        timestamp = time.strftime("%H:%M:%S", time.localtime(second))
+                    
+                    # Decode the binary protobuf message
+                    decoded = self.decoder.decode_message(payload)
+                    
+                    if decoded:
+                        self._format_decoded_message(lines, timestamp, decoded)
+                    else:
+                        lines.append(f"[{timestamp}] DECODE ERROR: {len(payload)} bytes")
+                        lines.append(f"  Raw hex: {payload.hex()}")
+                        lines.append("")
+                
+                # One write per batch instead of one per line
+                if lines:
+                    print("\n".join(lines))
                 
-                # Show name alongside numeric values where available
-                name_key = key + '_name'
-                if name_key in decoded['payload']:
-                    print(f"    {key}: {value} ({decoded['payload'][name_key]})")
+                # Flush gaps from the tail of a burst once no new gaps arrive
+                self.decoder.maybe_log_sequence_gaps()
+            except Exception:
+                logger.exception("Failed to process batch of %d messages", len(batch))
+    
+    def _format_decoded_message(self, lines: List[str], timestamp: str, decoded: Dict[str, Any]):
+        """Append the pretty-printed lines for a decoded message"""
+        lines.append(f"[{timestamp}] {decoded['type_name']} (0x{decoded['type']:02X})")
+        lines.append(f"  Sequence: {decoded['sequence']}")
+        lines.append(f"  Timestamp: {decoded['timestamp']} ms ({decoded['timestamp_sec']:.1f}s)")
+        
+        payload = decoded['payload']
+        if payload:
+            # Each message type always decodes to the same keys, so work out
+            # which to print (and their name fields) once per type
+            fields = self._field_layouts.get(decoded['type'])
+            if fields is None:
+                fields = self._field_layouts[decoded['type']] = _display_fields(payload)
+            
+            lines.append(f"  Payload:")
+            for key, name_key in fields:
+                if name_key:
+                    lines.append(f"    {key}: {payload[key]} ({payload[name_key]})")
                 else:
-                    print(f"    {key}: {value}")
+                    lines.append(f"    {key}: {payload[key]}")
         
-        print()
+        lines.append("")
     
     def print_statistics(self):
         """Print decoder statistics"""
         stats = self.decoder.get_statistics()
-        runtime = time.time() - self.start_time
+        runtime = time.monotonic() - self.start_time
         
         print("=" * 60)
         print("STATISTICS")
         print(f"Runtime: {runtime:.1f} seconds")
         print(f"Messages received: {stats['messages_received']}")
+        print(f"Messages dropped: {self.messages_dropped}")
         print(f"Messages decoded: {stats['messages_decoded']}")
         print(f"Decode errors: {stats['decode_errors']}")
+        print(f"Sequence gaps: {stats['sequence_gaps']}")
         print(f"Success rate: {stats['success_rate_percent']}%")
         print("=" * 60)
     
@@ -483,12 +640,23 @@ class MQTTProtobufMonitor:
                 
         except KeyboardInterrupt:
             print("\nShutting down...")
-            self.print_statistics()
             self.client.loop_stop()
             self.client.disconnect()
+            
+            # Let the worker finish anything already queued
+            if self.worker.is_alive():
+                try:
+                    self.message_queue.put(None, timeout=SHUTDOWN_TIMEOUT)
+                    self.worker.join(SHUTDOWN_TIMEOUT)
+                except queue.Full:
+                    logger.warning("Decode thread not draining, skipping queued messages")
+            self.decoder.log_sequence_gaps()
+            self.print_statistics()
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s', stream=sys.stdout)
+    
     print("LogSplitter MQTT Protobuf Monitor")
     print("Press Ctrl+C to stop")
     print()
@@ -21,7 +21,7 @@ running = True
 stats = {
     'messages_received': 0,
     'bytes_received': 0,
-    'start_time': time.time()
+    'start_time': time.monotonic()
 }
 
 logger = logging.getLogger(__name__)
@@ -53,7 +53,8 @@ def on_message(client, userdata, msg):
     stats['messages_received'] += 1
     stats['bytes_received'] += len(msg.payload)
     
-    logger.info(f"📦 Protobuf #{stats['messages_received']}: {len(msg.payload)} bytes")
+    # Per-message logging is debug-only; the periodic stats cover normal runs
+    logger.debug("📦 Protobuf #%d: %d bytes", stats['messages_received'], len(msg.payload))
     
     # TODO: Parse protobuf when schema is available
     # For now, just log the message reception
@@ -65,7 +66,7 @@ def on_disconnect(client, userdata, rc):
 
 def print_stats():
     """Print current statistics"""
-    uptime = time.time() - stats['start_time']
+    uptime = time.monotonic() - stats['start_time']
     rate = stats['messages_received'] / uptime if uptime > 0 else 0
     
     logger.info("=" * 50)
@@ -97,14 +98,14 @@ def main():
         client.loop_start()
         
         # Main loop
-        last_stats = time.time()
+        last_stats = time.monotonic()
         while running:
             time.sleep(1)
             
             # Print stats every 30 seconds
-            if time.time() - last_stats >= 30:
+            if time.monotonic() - last_stats >= 30:
                 print_stats()
-                last_stats = time.time()
+                last_stats = time.monotonic()
         
         print_stats()  # Final stats
         